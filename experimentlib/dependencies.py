@@ -18,7 +18,6 @@ versions = {
     'python-pushover': '0.4',
     'pyyaml': __yaml_version,
     'rexeg': __regex_version,
-    'tenacity': '7.0.0',
     'tzlocal': '2.1',
     'urllib3': _urllib3_version
 }
@@ -1,16 +1,15 @@
 from __future__ import annotations
-import getpass
 import os.path
-import socket
 import tempfile
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Iterable, Mapping, Optional, TextIO, Union
+from typing import Any, BinaryIO, Callable, Iterable, Mapping, Optional, TextIO, Union
 
 import yaml
 
 from experimentlib.data import unit
 from experimentlib.logging import classes
 from experimentlib.util import arg_helper, classes as util_classes, constant, time as elib_time
+from experimentlib.util.host import get_fqdn, get_username
 
 
 class ExtendedError(yaml.YAMLError):  # type: ignore[misc]
@@ -56,19 +55,23 @@ class ResolveTagError(ConstructorError):
     pass
 
 
-class ExtendedLoader(classes.Logged, yaml.SafeLoader):  # type: ignore[misc]
+# Use libyaml bindings when available, moves scanning and parsing of documents out of Python
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class ExtendedLoader(classes.Logged, _SafeLoader):  # type: ignore[misc, valid-type]
     """ An extended YAML loader including additional tags and security features. """
 
     # Shared mapping for format constructor (environment and system variables)
     _format_mapping_system: Mapping[str, str] = {
         'user_path': os.path.expanduser('~'),
         'temp_path': tempfile.gettempdir(),
-        'system_hostname': socket.getfqdn(),
-        'system_username': getpass.getuser(),
+        'system_hostname': get_fqdn(),
+        'system_username': get_username(),
         **{'env_' + env_var: env_val for env_var, env_val in os.environ.items()}
     }
 
-    def __init__(self, stream: Union[str, TextIO], enable_resolve: bool = False,
+    def __init__(self, stream: Union[str, TextIO, BinaryIO], enable_resolve: bool = False,
                  include_paths: Optional[Iterable[str]] = None,
                  format_kwargs: Optional[Mapping[str, str]] = None):
         self._stream_root: Optional[str]
@@ -81,7 +84,7 @@ class ExtendedLoader(classes.Logged, yaml.SafeLoader):  # type: ignore[misc]
             stream_filename = '<str>'
 
         classes.Logged.__init__(self, f"src:{stream_filename}")
-        yaml.SafeLoader.__init__(self, stream)
+        _SafeLoader.__init__(self, stream)
 
         # Flag to allow resolving of objects
         self._enable_resolve = enable_resolve
@@ -97,11 +100,14 @@ class ExtendedLoader(classes.Logged, yaml.SafeLoader):  # type: ignore[misc]
                     raise ExtendedError(f"Include path \"{path}\" not a directory")
 
                 self._include_paths.append(path)
-                self.logger().debug(f"Include allowed from \"{path}\"")
+                self.logger().debug('Include allowed from "%s"', path)
 
         # Additional format kwargs
         self._format_kwargs = format_kwargs
 
+        # Loader for included files, inheriting restricted paths
+        self._include_factory = type(self).factory(self._enable_resolve, self._include_paths, self._format_kwargs)
+
     def _format_str(self, format_str: str) -> str:
         """ Format specified string with system and environment variables.
 
@@ -233,10 +239,10 @@ class ExtendedLoader(classes.Logged, yaml.SafeLoader):  # type: ignore[misc]
             include_path_real = os.path.realpath(include_path_formatted)
 
             if os.path.isfile(include_path_real):
-                self.logger().debug(f"Including: {include_path_real}")
+                self.logger().debug('Including: %s', include_path_real)
                 break
             else:
-                self.logger().debug(f"File not found: {include_path_real}")
+                self.logger().debug('File not found: %s', include_path_real)
 
         if include_path_real is None:
             raise IncludeTagError('No valid filename in include tag', node)
@@ -246,10 +252,9 @@ class ExtendedLoader(classes.Logged, yaml.SafeLoader):  # type: ignore[misc]
                 raise IncludeTagError(f"Included file \"{include_path_real}\" not within restricted include path", node,
                                       include_node=False)
 
-        with open(include_path_real) as f:
+        with open(include_path_real, 'rb') as f:
             # Include from specified path, inheriting restricted paths
-            include_data = yaml.load(f, ExtendedLoader.factory(self._enable_resolve, self._include_paths,
-                                                               self._format_kwargs))
+            include_data = yaml.load(f, self._include_factory)
 
             return include_data
 
@@ -283,7 +288,7 @@ class ExtendedLoader(classes.Logged, yaml.SafeLoader):  # type: ignore[misc]
         :param kwargs: passed to constructor
         :return: wrapped constructor
         """
-        def f(stream: Union[str, TextIO]) -> ExtendedLoader:
+        def f(stream: Union[str, TextIO, BinaryIO]) -> ExtendedLoader:
             return cls(stream, *args, **kwargs)
 
         return f
@@ -300,7 +305,7 @@ ExtendedLoader.add_constructor('!resolve', ExtendedLoader.construct_resolve)
 ExtendedLoader.add_constructor('!timedelta', ExtendedLoader.construct_timedelta)
 
 
-def load(stream: Union[str, TextIO], *args: Any, **kwargs: Any) -> Any:
+def load(stream: Union[str, TextIO, BinaryIO], *args: Any, **kwargs: Any) -> Any:
     """ Equivalent to yaml.load using the extended loader
 
     :param stream: input string or stream object for parsing
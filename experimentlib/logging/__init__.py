@@ -1,13 +1,17 @@
+import functools
 import logging
 import logging.config
+import sys
+import types
 import typing
 
+from experimentlib.logging.handlers import BufferedFileHandler
 from experimentlib.logging.handlers.console import ColoramaStreamHandler
 from experimentlib.logging.levels import *
 
 
 # Loggers the generate lots of messages, can sometimes be useful to suppress output to provide cleaner logs
-_SUPPRESSED_LOGGERS = [
+_SUPPRESSED_LOGGERS = frozenset((
     'aioinflux',
     'matplotlib.font_manager',
     'pymodbus',
@@ -15,32 +19,70 @@ _SUPPRESSED_LOGGERS = [
     'transitions.core',
     'urllib3',
     'urllib3.connectionpool'
-]
+))
+
+# Logger instances for _SUPPRESSED_LOGGERS, resolved on first use
+_suppressed_logger_instances: typing.Optional[typing.List[logging.Logger]] = None
+
+
+# Shared extra mappings for log calls that do not provide their own, keyed by (notify, event)
+_EXTRA = {
+    (notify, event): types.MappingProxyType({'notify': notify, 'event': event})
+    for notify in (False, True)
+    for event in (False, True)
+}
+
+# Stack offset for ExtendedLogger methods calling Logger._log directly. From Python 3.11 frames within the logging module
+# are skipped when resolving stacklevel so the wrapper frame must be counted, previously the immediate caller of _log was
+# always skipped
+_STACK_OFFSET = 1 if sys.version_info >= (3, 11) else 0
+
+# Record formats for basic_logging, keyed by (include_process, include_thread, include_source)
+_BASIC_FORMAT = {
+    (include_process, include_thread, include_source): ''.join((
+        '%(asctime)s.%(msecs)03d [%(levelname).1s] ',
+        '%(processName)s ' if include_process else '',
+        '%(threadName)s ' if include_thread else '',
+        '%(name)s',
+        ' [%(filename)s:%(lineno)d]' if include_source else '',
+        ': %(message)s'
+    ))
+    for include_process in (False, True)
+    for include_thread in (False, True)
+    for include_source in (False, True)
+}
+
+# Date format for basic_logging
+_BASIC_DATEFMT = '%y%m%d %H:%M:%S'
+
+# Logging module settings saved by configure_fast_logging, restored by restore_logging_defaults
+_logging_defaults: typing.Optional[typing.Tuple[bool, bool, bool, typing.Optional[str]]] = None
+
+
+def _update_kwargs(in_kwargs: typing.Dict[str, typing.Any], notify: bool, event: bool,
+                   stack_offset: int = _STACK_OFFSET) -> None:
+    """ Add notify and event flags to the extra mapping and offset stacklevel for ExtendedLogger wrapper methods.
+
+    :param in_kwargs: keyword arguments to be passed to _log, updated in place
+    :param notify: True when the record should be forwarded to a user, False otherwise
+    :param event: True when the record should be recorded as an event, False otherwise
+    :param stack_offset: number of wrapper frames between the caller and _log
+    """
+    notify = bool(notify)
+    event = bool(event)
+
+    if 'extra' in in_kwargs:
+        in_kwargs['extra'] = {**in_kwargs['extra'], 'notify': notify, 'event': event}
+    else:
+        # Records only read from extra, so a shared mapping can be used
+        in_kwargs['extra'] = _EXTRA[(notify, event)]
+
+    in_kwargs['stacklevel'] = in_kwargs.get('stacklevel', 1) + stack_offset
 
 
 class ExtendedLogger(logging.Logger):
     """ Extended logger class with additional logging levels and support for useful filtering arguments. """
 
-    @staticmethod
-    def _update_kwargs(in_kwargs: typing.Dict[str, typing.Any], notify: bool, event: bool, stack_offset: int = 1) -> None:
-        if 'extra' not in in_kwargs:
-                in_kwargs['extra'] = {}
-
-        if notify:
-            in_kwargs['extra'].update({'notify': True})
-        else:
-            in_kwargs['extra'].update({'notify': False})
-
-        if event:
-            in_kwargs['extra'].update({'event': True})
-        else:
-            in_kwargs['extra'].update({'event': False})
-        
-        if 'stacklevel' in in_kwargs:
-            in_kwargs['stacklevel'] += stack_offset
-        else:
-            in_kwargs['stacklevel'] = 1 + stack_offset
-
     def log(self, level: int, msg: object, *args: object, notify: bool = False, event: bool = False, **kwargs: typing.Any) -> None:
         """ og 'msg % args' with specified level.
 
@@ -52,8 +94,11 @@ class ExtendedLogger(logging.Logger):
         :param kwargs: additional keyword arguments passed to _log
         :return:
         """
-        self._update_kwargs(kwargs, notify, event)
-        super().log(level, msg, *args, **kwargs)
+        if not self.isEnabledFor(level):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(level, msg, args, **kwargs)
 
     def comm(self, msg: object, *args: object, notify: bool = False, event: bool = False, **kwargs: typing.Any) -> None:
         """ Log 'msg % args' with severity 'COMM'.
@@ -66,8 +111,11 @@ class ExtendedLogger(logging.Logger):
         :param event: True when this log should be recorded as an event, False otherwise
         :param kwargs: additional keyword arguments passed to _log
         """
-        self._update_kwargs(kwargs, notify, event)
-        super().log(COMM, msg, *args, **kwargs)
+        if not self.isEnabledFor(COMM):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(COMM, msg, args, **kwargs)
     
     def sleep(self, msg: object, *args: object, notify: bool = False, event: bool = False, **kwargs: typing.Any) -> None:
         """ Log 'msg % args' with severity 'SLEEP'.
@@ -80,8 +128,11 @@ class ExtendedLogger(logging.Logger):
         :param event: True when this log should be recorded as an event, False otherwise
         :param kwargs: additional keyword arguments passed to _log
         """
-        self._update_kwargs(kwargs, notify, event)
-        super().log(SLEEP, msg, *args, **kwargs)
+        if not self.isEnabledFor(SLEEP):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(SLEEP, msg, args, **kwargs)
 
     def trace(self, msg: object, *args: object, notify: bool = False, event: bool = False, **kwargs: typing.Any) -> None:
         """ Log 'msg % args' with severity 'TRACE'.
@@ -94,8 +145,11 @@ class ExtendedLogger(logging.Logger):
         :param event: True when this log should be recorded as an event, False otherwise
         :param kwargs: additional keyword arguments passed to _log
         """
-        self._update_kwargs(kwargs, notify, event)
-        super().log(TRACE, msg, *args, **kwargs)
+        if not self.isEnabledFor(TRACE):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(TRACE, msg, args, **kwargs)
 
     def lock(self, msg: object, *args: object, notify: bool = False, event: bool = False, **kwargs: typing.Any) -> None:
         """ Log 'msg % args' with severity 'LOCK'.
@@ -108,8 +162,11 @@ class ExtendedLogger(logging.Logger):
         :param event: True when this log should be recorded as an event, False otherwise
         :param kwargs: additional keyword arguments passed to _log
         """
-        self._update_kwargs(kwargs, notify, event)
-        super().log(LOCK, msg, *args, **kwargs)
+        if not self.isEnabledFor(LOCK):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(LOCK, msg, args, **kwargs)
 
     def meta(self, msg: object, *args: object, notify: bool = False, event: bool = False, **kwargs: typing.Any) -> None:
         """ Log 'msg % args' with severity 'META'.
@@ -122,53 +179,95 @@ class ExtendedLogger(logging.Logger):
         :param event: True when this log should be recorded as an event, False otherwise
         :param kwargs: additional keyword arguments passed to _log
         """
-        self._update_kwargs(kwargs, notify, event)
-        super().log(META, msg, *args, **kwargs)
+        if not self.isEnabledFor(META):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(META, msg, args, **kwargs)
 
     def debug(self, msg: object, *args: object, notify: bool = False, event: bool = False, **kwargs: typing.Any) -> None:
-        self._update_kwargs(kwargs, notify, event)
-        super().debug(msg, *args, **kwargs)
+        if not self.isEnabledFor(DEBUG):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(DEBUG, msg, args, **kwargs)
 
     def info(self, msg: object, *args: object, notify: bool = False, event: bool = False, **kwargs: typing.Any) -> None:
-        self._update_kwargs(kwargs, notify, event)
-        super().info(msg, *args, **kwargs)
+        if not self.isEnabledFor(INFO):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(INFO, msg, args, **kwargs)
 
     def warning(self, msg: object, *args: object, notify: bool = False, event: bool = False, **kwargs: typing.Any) -> None:
-        self._update_kwargs(kwargs, notify, event)
-        super().warning(msg, *args, **kwargs)
+        if not self.isEnabledFor(WARNING):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(WARNING, msg, args, **kwargs)
 
     def error(self, msg: object, *args: object, notify: bool = True, event: bool = True, **kwargs: typing.Any) -> None:
-        self._update_kwargs(kwargs, notify, event)
-        super().error(msg, *args, **kwargs)
+        if not self.isEnabledFor(ERROR):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(ERROR, msg, args, **kwargs)
+
+    def exception(self, msg: object, *args: object, exc_info: typing.Any = True, notify: bool = True,
+                  event: bool = True, **kwargs: typing.Any) -> None:
+        if not self.isEnabledFor(ERROR):
+            return
 
-    def exception(self, msg: object, *args: object, **kwargs: typing.Any) -> None:
-        self._update_kwargs(kwargs, True, True, 2)
-        super().exception(msg, *args, **kwargs)
+        _update_kwargs(kwargs, notify, event)
+        self._log(ERROR, msg, args, exc_info=exc_info, **kwargs)
 
     def critical(self, msg: object, *args: object, notify: bool = True, event: bool = True, **kwargs: typing.Any) -> None:
-        self._update_kwargs(kwargs, notify, event)
-        super().critical(msg, *args, **kwargs)
+        if not self.isEnabledFor(CRITICAL):
+            return
+
+        _update_kwargs(kwargs, notify, event)
+        self._log(CRITICAL, msg, args, **kwargs)
 
 
 # Replace base logging class with extended version
 logging.setLoggerClass(ExtendedLogger)
 
 
+# Loggers previously returned by get_logger, avoids taking the logging module lock on repeated lookups
+_logger_cache: typing.Dict[typing.Optional[str], ExtendedLogger] = {}
+
+
 def get_logger(name: typing.Optional[str] = None) -> ExtendedLogger:
     """ Wrapper for standard getLogger method.
 
     :param name: name of logger, otherwise root logger is returned
     :return: derived Logger
     """
-    logger = logging.getLogger(name)
-    logger = typing.cast(ExtendedLogger, logger)
+    try:
+        logger = _logger_cache[name]
+    except KeyError:
+        # Logger class is replaced with ExtendedLogger on import
+        logger = _logger_cache[name] = logging.getLogger(name)  # type: ignore[assignment]
 
-    # Ensure logger is enabled
-    logger.disabled = False
+    # Ensure logger is enabled (existing loggers may be disabled by dict_config)
+    if logger.disabled:
+        logger.disabled = False
 
     return logger
 
 
+@functools.lru_cache(maxsize=None)
+def _get_formatter(fmt: typing.Optional[str], datefmt: typing.Optional[str], style: str) -> logging.Formatter:
+    """ Get formatter for the specified format, shared between calls to basic_logging.
+
+    :param fmt: record format string
+    :param datefmt: date format string
+    :param style: format string style
+    :return: Formatter
+    """
+    return logging.Formatter(fmt, datefmt, style)  # type: ignore[arg-type]
+
+
 def basic_logging(filename: typing.Optional[str] = None, suppress_suggested: bool = True, include_thread: bool = False,
                   include_process: bool = False, include_source: bool = False, **kwargs: typing.Any) -> None:
     """ Wrapper for standard basic logging that uses a colourised console stream by default.
@@ -182,32 +281,75 @@ def basic_logging(filename: typing.Optional[str] = None, suppress_suggested: boo
     if 'handlers' not in kwargs:
         kwargs['handlers'] = [ColoramaStreamHandler()]
 
-    if 'format' not in kwargs:
-        kwargs['format'] = (
-            '%(asctime)s.%(msecs)03d [%(levelname).1s] ' +
-            ('%(processName)s ' if include_process else '') +
-            ('%(threadName)s ' if include_thread else '') +
-            '%(name)s' + 
-            (' [%(filename)s:%(lineno)d]' if include_source else '') +
-            ': %(message)s'
-        )
+    if 'format' in kwargs:
+        fmt = kwargs.pop('format')
+    else:
+        fmt = _BASIC_FORMAT[(bool(include_process), bool(include_thread), bool(include_source))]
 
-    if 'datefmt' not in kwargs:
-        kwargs['datefmt'] = '%y%m%d %H:%M:%S'
+    datefmt = kwargs.pop('datefmt') if 'datefmt' in kwargs else _BASIC_DATEFMT
 
     if filename is not None:
         # Manually add to handlers list
-        kwargs['handlers'].append(logging.FileHandler(filename, encoding='utf-8'))
+        kwargs['handlers'].append(BufferedFileHandler(filename, encoding='utf-8'))
+
+    # Attach formatter before basicConfig, handlers with an existing formatter are left unchanged
+    formatter = _get_formatter(fmt, datefmt, kwargs.pop('style', '%'))
+
+    for handler in kwargs['handlers']:
+        if handler.formatter is None:
+            handler.setFormatter(formatter)
 
-    if 'level' in kwargs and type(kwargs['level']) is str:
+    level = kwargs.get('level')
+
+    if isinstance(level, str):
         # Convert string to level number, supports additional levels without modding logging.basicConfig
-        kwargs['level'] = NAME_TO_LEVEL[kwargs['level'].upper()]
+        kwargs['level'] = NAME_TO_LEVEL[level.upper()]
 
     logging.basicConfig(**kwargs)
 
     if suppress_suggested:
-        for logger_name in _SUPPRESSED_LOGGERS:
-            logging.getLogger(logger_name).setLevel(INFO)
+        global _suppressed_logger_instances
+
+        if _suppressed_logger_instances is None:
+            _suppressed_logger_instances = [logging.getLogger(logger_name) for logger_name in _SUPPRESSED_LOGGERS]
+
+        for logger in _suppressed_logger_instances:
+            logger.setLevel(INFO)
+
+
+def configure_fast_logging(include_process: bool = False, include_thread: bool = False,
+                           include_source: bool = False) -> None:
+    """ Reduce per-record overhead by disabling collection of record attributes that are not required. Should be called
+    once at application startup. Disabled attributes are left at their logging module defaults (source file is reported
+    as "(unknown file)", thread and process names as None). Settings apply to all loggers in the process, previous
+    settings can be restored using restore_logging_defaults.
+
+    :param include_process: if False process information is not collected
+    :param include_thread: if False thread information is not collected
+    :param include_source: if False source file, line and function are not resolved from the call stack
+    """
+    global _logging_defaults
+
+    if _logging_defaults is None:
+        _logging_defaults = (logging.logProcesses, logging.logMultiprocessing, logging.logThreads, logging._srcfile)
+
+    logging.logProcesses = include_process
+    logging.logMultiprocessing = include_process
+    logging.logThreads = include_thread
+
+    # Source file is used to identify logging module frames, restored in case it was previously disabled
+    logging._srcfile = _logging_defaults[3] if include_source else None
+
+
+def restore_logging_defaults() -> None:
+    """ Restore logging module settings changed by configure_fast_logging. """
+    global _logging_defaults
+
+    if _logging_defaults is None:
+        return
+
+    logging.logProcesses, logging.logMultiprocessing, logging.logThreads, logging._srcfile = _logging_defaults
+    _logging_defaults = None
 
 
 def dict_config(config: typing.Dict[str, typing.Any]) -> None:
@@ -8,19 +8,34 @@ from experimentlib import logging
 from experimentlib.util.classes import HybridMethod
 
 
+# Shortest sleep interval (in seconds) that is timed and logged
+_SLEEP_LOG_MIN = 1e-3
+
+
 TMeta = TypeVar('TMeta', bound=type)
 TABCMeta = TypeVar('TABCMeta', bound=ABCMeta)
 
 
+def _attach_cls_logger(x: type, name: str) -> None:
+    """ Assign class logger to a newly created class.
+
+    :param x: class
+    :param name: class name
+    """
+    x._logged_cls = logging.get_logger(name + ':cls')  # type: ignore[attr-defined]
+    x._logged_obj_prefix = name + ':'  # type: ignore[attr-defined]
+
+    if x._logged_cls.isEnabledFor(logging.META):  # type: ignore[attr-defined]
+        # Offset to caller of metaclass __new__
+        x._logged_cls.log(logging.META, 'Created in module %s', x.__module__, stacklevel=3)  # type: ignore[attr-defined]
+
+
 class LoggedMeta(type):
     """ Metaclass that creates a logger instance for all classes derived from  """
 
     def __new__(cls: Type[TMeta], name: str, bases: Tuple[Type[object]], classdict: Dict[str, str]) -> TMeta:
         x = type.__new__(cls, name, bases, classdict)
-
-        # Assign class logger
-        x._logged_cls = logging.get_logger(name + ':cls')  # type: ignore[attr-defined]
-        x._logged_cls.log(logging.META, 'Created', stacklevel=2)  # type: ignore[attr-defined]
+        _attach_cls_logger(x, name)
 
         return x
 
@@ -28,22 +43,22 @@ class LoggedMeta(type):
 class LoggedAbstractMeta(ABCMeta):
     def __new__(cls: Type[TABCMeta], name: str, bases: Tuple[Type[object]], classdict: Dict[str, str]) -> TABCMeta:
         x = ABCMeta.__new__(cls, name, bases, classdict)
-
-        # Assign class logger
-        setattr(x, '_logged_cls', logging.get_logger(name + ':cls'))  # type: ignore[attr-defined]
-        x._logged_cls.log(logging.META, 'Created', stacklevel=2)  # type: ignore[attr-defined]
+        _attach_cls_logger(x, name)
 
         return x
 
 
 class _LoggedBase(object):
+    # Instance logger name prefix, assigned by metaclass
+    _logged_obj_prefix: str
+
     def __init__(self, logger_instance_name: Optional[str] = None):
         """ Base class that contains a logger attached to both the class definition (allowing use in class or static
         methods) and to class instances. An optional string can be appended to the logger name.
 
         :param logger_instance_name: optional string to append to logger name
         """
-        self._logged_obj = logging.get_logger(self.__class__.__name__ + ':' + (logger_instance_name or 'obj'))
+        self._logged_obj = logging.get_logger(self._logged_obj_prefix + (logger_instance_name or 'obj'))
         self._logged_obj.meta('Created', stacklevel=2)
 
     @HybridMethod
@@ -53,14 +68,15 @@ class _LoggedBase(object):
 
         :return: class or instance ExtendedLogger
         """
-        if issubclass(self.__class__, _LoggedBase):
-            return self._logged_obj
-        else:
-            return self._logged_cls
+        return self._logged_obj
+
+    @logger.class_method  # type: ignore[no-redef]
+    def logger(cls) -> logging.ExtendedLogger:
+        return cls._logged_cls  # type: ignore[attr-defined]
 
     def sleep(self, interval: Union[None, int, float, timedelta], cause: Optional[str] = None,
               silent: bool = False, log_level: Optional[int] = None) -> None:
-        """ Sleep for perceribed interval logging the entry and exit time.
+        """ Sleep for perceribed interval logging the entry and exit time. Intervals shorter than 1 ms are not logged.
 
         :param interval:
         :param cause:
@@ -75,23 +91,22 @@ class _LoggedBase(object):
         if interval is None or interval <= 0:
             return
 
+        logger = self.logger()
+
+        if silent or interval < _SLEEP_LOG_MIN or not logger.isEnabledFor(log_level):
+            # Skip timing and message formatting when nothing will be logged
+            sleep(interval)
+            return
+
+        cause = cause or 'unspecified'
+
         tic = default_timer()
-        if not silent:
-            self.logger().log(
-                log_level,
-                f"Sleep {interval:.3g} sec (cause: {cause if cause else 'unspecified'})",
-                stacklevel=2
-            )
-        
+        logger.log(log_level, 'Sleep %.3g sec (cause: %s)', interval, cause, stacklevel=2)
+
         sleep(interval)
 
-        if not silent:
-            self.logger().log(
-                log_level,
-                f"Sleep complete (cause: {cause if cause else 'unspecified'}, target: {interval:.3g} sec, "
-                f"actual: {(default_timer() - tic):.6g} sec)",
-                stacklevel=2
-            )
+        logger.log(log_level, 'Sleep complete (cause: %s, target: %.3g sec, actual: %.6g sec)', cause, interval,
+                   default_timer() - tic, stacklevel=2)
 
 
 class Logged(_LoggedBase, metaclass=LoggedMeta):
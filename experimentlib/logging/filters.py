@@ -1,3 +1,4 @@
+import functools
 import logging
 import typing
 
@@ -6,8 +7,10 @@ T_FILTER_CALLABLE = typing.Callable[[logging.LogRecord], bool]
 T_FILTER = typing.Union[logging.Filter, T_FILTER_CALLABLE]
 
 
+@functools.lru_cache(maxsize=32)
 def discard_name_prefix_factory(name: str) -> T_FILTER_CALLABLE:
-    """ Filter factory to discard records from loggers with specified prefix.
+    """ Filter factory to discard records from loggers with specified prefix. Filters are stateless so a single instance
+    is shared for each prefix.
 
     :param name: logger name prefix to discard
     :return: logging filter callable
@@ -24,7 +27,7 @@ def only_event_factory() -> T_FILTER_CALLABLE:
     :return: logging filter callable
     """
     def f(record: logging.LogRecord) -> bool:
-        return hasattr(record, 'event') and record.event
+        return getattr(record, 'event', False)
 
     return f
 
@@ -35,6 +38,6 @@ def only_notify_factory() -> T_FILTER_CALLABLE:
     :return: logging filter callable
     """
     def f(record: logging.LogRecord) -> bool:
-        return hasattr(record, 'notify') and record.notify
+        return getattr(record, 'notify', False)
 
     return f
@@ -1,24 +1,46 @@
 import html
 import logging
 import re
+from typing import Optional, Tuple
 
 
 class InfluxDBFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
-        lines = [record.getMessage().strip()]
+        message = record.getMessage().strip()
 
-        if record.exc_info:
-            lines.extend([''] + self.formatException(record.exc_info).split('\n'))
+        if not record.exc_info:
+            return message
+
+        # Cache formatted traceback on record, shared with other formatters
+        if not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
 
-        return '\n'.join(lines)
+        return f"{message}\n\n{record.exc_text}"
 
 
 class PushoverFormatter(logging.Formatter):
     _MSG_CHAR_LIMIT = 1024
 
-    _RE_EXC_FILE = re.compile(r'^\s*File "([^,]+)",[^\d]*([\d]+), in\s+(.*)$')
+    # Matches traceback start, frame location with optional source line (excluding position markers) or unindented lines
+    # which include the exception type and message
+    _RE_TRACEBACK = re.compile(
+        r'^Traceback \(most recent call last\):$'
+        r'|^  File "(?P<file>[^"]+)", line (?P<line>\d+), in (?P<func>.+)$'
+        r'(?:\n    (?![\s^~]+$)(?P<code>.*\S))?'
+        r'|^(?P<exc>\S.*)$',
+        re.MULTILINE
+    )
+
+    # Record attribute used to cache formatted output, shared between handlers as the formatter has no configuration.
+    # Output is stored with the exception information used, as handlers may format records with exceptions excluded
+    _CACHE_ATTR = '_pushover_formatted'
 
     def format(self, record: logging.LogRecord) -> str:
+        cached: Optional[Tuple[object, str]] = getattr(record, self._CACHE_ATTR, None)
+
+        if cached is not None and cached[0] is record.exc_info:
+            return cached[1]
+
         msg_lines = [
             record.getMessage().strip(),
             '',
@@ -33,53 +55,43 @@ class PushoverFormatter(logging.Formatter):
         if record.processName:
             msg_lines.append(f"<b>Process:</b> {record.processName} (id: {record.process})")
 
-        msg = '\n'.join(msg_lines)
-
         if record.exc_info:
-            msg_lines = []
-
-            # Get allowable length
-            msg_remaining = self._MSG_CHAR_LIMIT - len(msg)
-
-            # Get a summarised version of the traceback
-            exc_lines = self.formatException(record.exc_info).split('\n')
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
 
+            # Get a summarised version of the traceback, each traceback (including chained exceptions) is reduced to the
+            # exception and the last frame
             traceback_flag = False
             traceback_code = None
             traceback_file = None
 
-            for exc_line in exc_lines:
-                if traceback_flag:
-                    if exc_line.startswith('    '):
-                        traceback_code = exc_line.strip()
-                    elif exc_line.startswith('  '):
-                        traceback_file_match = self._RE_EXC_FILE.match(exc_line)
-
-                        if traceback_file is not None:
-                            traceback_file = f"{html.escape(traceback_file_match[3])} in " \
-                                             f"\"{traceback_file_match[1]}\", line {traceback_file_match[2]}"
-                    else:
+            for match in self._RE_TRACEBACK.finditer(record.exc_text):
+                if match['file'] is not None:
+                    if traceback_flag:
+                        traceback_file = f"{html.escape(match['func'])} in \"{match['file']}\", line {match['line']}"
+                        traceback_code = match['code'] or 'unknown'
+                elif match['exc'] is not None:
+                    if traceback_flag:
                         # Last line of traceback contains exception type and message
-                        msg_lines.extend([
+                        msg_lines.extend((
                             '',
-                            f"<b>Exception:</b> {exc_line.strip()}",
+                            f"<b>Exception:</b> {match['exc'].strip()}",
                             f"  <b>from:</b> {traceback_file}",
                             f"  <b>code:</b> <tt>{traceback_code}</tt>"
-                        ])
+                        ))
 
                         traceback_flag = False
-                elif exc_line.startswith('Traceback '):
+                else:
                     traceback_flag = True
                     traceback_code = 'unknown'
                     traceback_file = 'unknown'
-                    continue
 
-            exc_msg = '\n'.join(msg_lines)
+        msg = '\n'.join(msg_lines)
 
-            if len(exc_msg) > msg_remaining:
-                # Truncate exception lines
-                exc_msg = exc_msg[:msg_remaining]
+        if len(msg) > self._MSG_CHAR_LIMIT:
+            # Truncate to Pushover message length limit
+            msg = msg[:self._MSG_CHAR_LIMIT]
 
-            msg += exc_msg
+        setattr(record, self._CACHE_ATTR, (record.exc_info, msg))
 
         return msg
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import atexit
+import bisect
+import collections
+import copy
+import io
 import logging
 import logging.handlers
 import queue as queue_lib
@@ -11,6 +15,11 @@ import typing
 # noinspection PyUnresolvedReferences
 from logging.config import ConvertingDict, ConvertingList, valid_ident
 
+from experimentlib.logging import levels
+
+
+_T = typing.TypeVar('_T')
+
 
 def _resolve_converting_dict(convert_dict: ConvertingDict) -> typing.Any:
     # Check for cached conversion result
@@ -39,6 +48,80 @@ def _resolve_converting_list(convert_list: ConvertingList) -> typing.List:
     return [convert_list[i] for i in range(len(convert_list))]
 
 
+def _nearest(keys: typing.List[int], x: int, rank: typing.Optional[typing.Mapping[int, int]] = None) -> int:
+    """ Find the closest value to x in a sorted list. When equidistant the value with the lower rank is preferred, or
+    the lower value if no rank is provided.
+
+    :param keys: sorted list of values
+    :param x: target value
+    :param rank: optional tie-break order for values, lower rank is preferred
+    :return: closest value from keys
+    """
+    i = bisect.bisect_left(keys, x)
+
+    if i == 0:
+        return keys[0]
+
+    if i == len(keys):
+        return keys[-1]
+
+    lower = keys[i - 1]
+    upper = keys[i]
+
+    if x - lower == upper - x and rank is not None:
+        return lower if rank[lower] <= rank[upper] else upper
+
+    return lower if x - lower <= upper - x else upper
+
+
+class _NearestLevelMap(typing.Generic[_T]):
+    """ Lookup of values configured for specific logging levels, records at other levels use the value of the closest
+    configured level. Results are cached per level as the set of levels in use is small, known levels are resolved up
+    front so lookups on the emit path are usually a single dict access.
+    """
+
+    def __init__(self, mapping: typing.Mapping[int, _T]):
+        """
+
+        :param mapping: values for configured logging levels
+        """
+        self._mapping = mapping
+        self._keys = sorted(mapping)
+
+        # Equidistant levels resolve to the level listed first in the mapping
+        self._rank = {levelno: n for n, levelno in enumerate(mapping)}
+        self._cache: typing.Dict[int, _T] = {}
+
+        for levelno in levels.NAME_TO_LEVEL.values():
+            self[levelno]
+
+    def __getitem__(self, levelno: int) -> _T:
+        try:
+            return self._cache[levelno]
+        except KeyError:
+            value = self._cache[levelno] = self._mapping[_nearest(self._keys, levelno, self._rank)]
+
+            return value
+
+
+def _format_without_exc_info(format_func: typing.Callable[[logging.LogRecord], str],
+                             record: logging.LogRecord) -> str:
+    """ Format a record excluding exception information, avoids formatting traceback for handlers that don't need it.
+    A copy of the record is formatted as the record may be shared with handlers on other threads.
+
+    :param format_func: formatter method
+    :param record: log record
+    :return: formatted record
+    """
+    if not record.exc_info and not record.exc_text:
+        return format_func(record)
+
+    record = copy.copy(record)
+    record.exc_info = record.exc_text = None
+
+    return format_func(record)
+
+
 class BufferedHandler(logging.Handler):
     """ Log buffer, useful for presentation of records in a user interface while discarding messages beyond a limit or
     after a specified time.
@@ -57,9 +140,13 @@ class BufferedHandler(logging.Handler):
         self._record_limit = record_limit
         self._record_timeout = record_timeout
 
-        self._record_buffer: typing.List[logging.LogRecord] = []
+        # Count limit is enforced by the deque on append
+        self._record_buffer: typing.Deque[logging.LogRecord] = collections.deque(maxlen=record_limit or None)
         self._record_lock = threading.RLock()
 
+        # Snapshot of buffer returned by records, cleared when buffer changes
+        self._records_cache: typing.Optional[typing.Tuple[logging.LogRecord, ...]] = None
+
     def emit(self, record: logging.LogRecord) -> None:
         with self._record_lock:
             # Discard old records
@@ -67,10 +154,12 @@ class BufferedHandler(logging.Handler):
 
             # Append record to buffer
             self._record_buffer.append(record)
+            self._records_cache = None
 
     def flush(self) -> None:
         with self._record_lock:
             self._record_buffer.clear()
+            self._records_cache = None
 
     @property
     def records(self) -> typing.Tuple[logging.LogRecord, ...]:
@@ -78,21 +167,84 @@ class BufferedHandler(logging.Handler):
             # Discard old records
             self._update()
 
-            return tuple(self._record_buffer)
+            if self._records_cache is None:
+                self._records_cache = tuple(self._record_buffer)
+
+            return self._records_cache
 
     def _update(self) -> None:
-        """ Discard records beyond the configured record count limit and/or configures record timeout.
+        """ Discard records older than the configured record timeout.
         """
-        if self._record_limit:
-            while len(self._record_buffer) > self._record_limit:
-                self._record_buffer.pop(0)
-
         if self._record_timeout:
             expiry = time.time() - self._record_timeout
 
-            while len(self._record_buffer) > 0:
-                if self._record_buffer[0].created < expiry:
-                    self._record_buffer.pop(0)
+            if not self._record_buffer or self._record_buffer[0].created >= expiry:
+                # Oldest record has not expired
+                return
+
+            self._records_cache = None
+
+            if self._record_buffer[-1].created < expiry:
+                # All records expired, typically after an idle period
+                self._record_buffer.clear()
+                return
+
+            while self._record_buffer[0].created < expiry:
+                self._record_buffer.popleft()
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """ File handler that buffers writes, only flushing to disk for records at or above a specified level. Buffered
+    records are otherwise written when the buffer fills or the handler is flushed or closed (including at shutdown).
+    """
+
+    def __init__(self, filename: str, mode: str = 'a', encoding: typing.Optional[str] = 'utf-8', delay: bool = False,
+                 errors: typing.Optional[str] = None, buffer_size: int = 65536, flush_level: int = logging.ERROR):
+        """
+
+        :param filename: output file path
+        :param mode: file mode
+        :param encoding: file encoding
+        :param delay: if True file opening is deferred until the first record is emitted
+        :param errors: encoding error handling
+        :param buffer_size: size of file write buffer in bytes
+        :param flush_level: minimum record level that causes an immediate flush
+        """
+        self._buffer_size = buffer_size
+        self._flush_level = flush_level
+
+        logging.FileHandler.__init__(self, filename, mode, encoding, delay, errors)
+
+    def _open(self) -> io.TextIOWrapper:
+        # Mode is always text so open returns a TextIOWrapper
+        return typing.cast(io.TextIOWrapper, open(self.baseFilename, self.mode, buffering=self._buffer_size,
+                                                  encoding=self.encoding, errors=self.errors))
+
+    def close(self) -> None:
+        logging.FileHandler.close(self)
+
+        # Set by logging.FileHandler from Python 3.10
+        self._closed = True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        stream = self.stream
+
+        if stream is None:
+            # Don't reopen (and truncate) file after close, matches logging.FileHandler (bpo-42378)
+            if self.mode == 'w' and getattr(self, '_closed', False):
+                return
+
+            stream = self.stream = self._open()
+
+        try:
+            stream.write(self.format(record) + self.terminator)
+
+            if record.levelno >= self._flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 # Quotes required to ensure compatibility with Python < 3.9
@@ -106,13 +258,17 @@ class QueueListenerHandler(logging.handlers.QueueHandler):
         if isinstance(queue, ConvertingDict):
             queue = _resolve_converting_dict(queue)
         elif not queue:
-            queue = queue_lib.Queue(queue_size)
+            # Unbounded queues use the faster SimpleQueue
+            queue = queue_lib.SimpleQueue() if queue_size <= 0 else queue_lib.Queue(queue_size)
 
         if isinstance(handlers, ConvertingList):
             handlers = _resolve_converting_list(handlers)
 
         logging.handlers.QueueHandler.__init__(self, queue)
 
+        # Count of records discarded while the queue was full
+        self._dropped = 0
+
         # Create listener thread
         self._listener = logging.handlers.QueueListener(self.queue, *handlers,
                                                         respect_handler_level=respect_handler_level)
@@ -123,6 +279,23 @@ class QueueListenerHandler(logging.handlers.QueueHandler):
             # Stop listener on exit
             atexit.register(self.stop)
 
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue_lib.Full:
+            # Drop records rather than blocking or reporting an error for each record while the listener catches up
+            self._dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records are consumed in the same process, formatting is left to the listener handlers which also keeps args
+        # and exc_info available to them. A shallow copy is queued as handlers on either thread may set attributes on
+        # the record while formatting
+        return copy.copy(record)
+
     def start(self) -> None:
         self._listener.start()
 
@@ -1,5 +1,4 @@
 import logging
-import re
 import sys
 from typing import Mapping, Optional, TextIO
 
@@ -10,7 +9,7 @@ from experimentlib.logging import levels
 
 class ColoramaStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
     """ Colourised stream handler. """
-    DEFAULT_COLOR_MAP: Mapping[int, int] = {
+    DEFAULT_COLOR_MAP: Mapping[int, str] = {
         levels.META: colorama.Fore.LIGHTBLUE_EX,
         levels.LOCK: colorama.Style.BRIGHT + colorama.Fore.LIGHTBLACK_EX,
         levels.TRACE: colorama.Style.BRIGHT + colorama.Fore.LIGHTBLACK_EX,
@@ -21,33 +20,54 @@ class ColoramaStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
         logging.CRITICAL: colorama.Back.RED + colorama.Fore.BLACK
     }
 
-    __RE_TRACEBACK = re.compile(r'^[a-z._]+: ', re.IGNORECASE)
-
     def __init__(self, stream: Optional[TextIO] = None,
-                 color_map: Optional[Mapping[int, int]] = None):
+                 color_map: Optional[Mapping[int, str]] = None):
         stream = stream or sys.stdout
 
         logging.StreamHandler.__init__(self, colorama.AnsiToWin32(stream).stream)
 
         self.color_map = color_map or self.DEFAULT_COLOR_MAP
+        self._reset = colorama.Style.RESET_ALL
 
-    @property
-    def is_tty(self) -> bool:
+        self._is_tty = self._check_tty()
+
+    def _check_tty(self) -> bool:
         # Check if stream is outputting to interactive session
         isatty = getattr(self.stream, 'isatty', None)
 
         return bool(isatty and isatty())
 
+    def setStream(self, stream: TextIO) -> Optional[TextIO]:  # type: ignore[override]
+        result = logging.StreamHandler.setStream(self, stream)
+
+        self._is_tty = self._check_tty()
+
+        return result
+
+    @property
+    def is_tty(self) -> bool:
+        return self._is_tty
+
     def format(self, record: logging.LogRecord) -> str:
         message = logging.StreamHandler.format(self, record)
 
-        if self.is_tty:
-            message = '\n'.join((self.colorize(line, record) for line in message.split('\n')))
+        if not self._is_tty:
+            return message
+
+        color = self.color_map.get(record.levelno)
 
-        return message
+        if color is None:
+            # Unmapped levels are not coloured
+            return message
+
+        # Colour each line individually so continuation lines remain coloured if output is interleaved
+        return color + message.replace('\n', self._reset + '\n' + color) + self._reset
 
     def colorize(self, message: str, record: logging.LogRecord) -> str:
-        try:
-            return f"{self.color_map[record.levelno]}{message}{colorama.Style.RESET_ALL}"
-        except KeyError:
+        color = self.color_map.get(record.levelno)
+
+        if color is None:
+            # Unmapped levels are not coloured
             return message
+
+        return color + message + self._reset
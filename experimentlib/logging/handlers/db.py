@@ -2,28 +2,38 @@ from __future__ import annotations
 
 import collections.abc
 import logging
-import socket
+import sys
+import threading
 from enum import IntEnum
 from typing import Any, Mapping, MutableMapping, Optional, Union
 
 import urllib3
 from influxdb_client import InfluxDBClient, Point, WritePrecision
-from influxdb_client.client.write_api import PointSettings
+from influxdb_client.client.write_api import PointSettings, WriteApi, WriteOptions, WriteType
+from influxdb_client.service.health_service import HealthService
 
 import experimentlib
 from experimentlib.logging import levels
 from experimentlib.logging.filters import discard_name_prefix_factory
 from experimentlib.logging.formatters import InfluxDBFormatter
+from experimentlib.logging.handlers import _format_without_exc_info, _NearestLevelMap
 from experimentlib.util.arg_helper import get_args
+from experimentlib.util.host import get_fqdn, get_hostname
 
 
 class InfluxDBHandlerError(experimentlib.ExperimentLibError):
     pass
 
 
+# Syslog severity keywords indexed by severity level
+_SEVERITY_KEYWORDS = ('emerg', 'alert', 'crit', 'err', 'warning', 'notice', 'info', 'debug')
+
+
 class InfluxDBHandler(logging.Handler):
-    # HTTP options
+    # HTTP options, defaults used unless provided in client arguments
     RETRIES = urllib3.Retry(3, redirect=3, backoff_factor=1)
+    CONNECTION_POOL_MAXSIZE = 32
+    ENABLE_GZIP = True
 
     # Log keywords (syslog compatible)
     FACILITY_CODE = 14
@@ -42,22 +52,7 @@ class InfluxDBHandler(logging.Handler):
 
         @property
         def keyword(self) -> str:
-            if self == self.EMERGENCY:
-                return 'emerg'
-            elif self == self.ALERT:
-                return 'alert'
-            elif self == self.CRITICAL:
-                return 'crit'
-            elif self == self.ERROR:
-                return 'err'
-            elif self == self.WARNING:
-                return 'warning'
-            elif self == self.NOTICE:
-                return 'notice'
-            elif self == self.INFORMATIONAL:
-                return 'info'
-            else:
-                return 'debug'
+            return _SEVERITY_KEYWORDS[self.value]
 
     _DEFAULT_SEVERITY_MAP: Mapping[int, InfluxDBHandler.Severity] = {
         logging.DEBUG: Severity.DEBUG,
@@ -67,12 +62,17 @@ class InfluxDBHandler(logging.Handler):
         logging.CRITICAL: Severity.CRITICAL
     }
 
-    def __init__(self, bucket: Union[str, Mapping[str, str]], name: Optional[str] = None,
+    def __init__(self, bucket: Union[str, Mapping[Union[str, int], str]], name: Optional[str] = None,
                  client_args: Optional[Mapping[str, Any]] = None, level: int = logging.NOTSET,
                  measurement: Optional[str] = None,
-                 severity_map: Optional[Mapping[int, Union[int, Severity]]] = None):
+                 severity_map: Optional[Mapping[int, Union[int, Severity]]] = None,
+                 batch_size: int = 1000, flush_interval: float = 1.0, jitter_interval: float = 0.0,
+                 extended_tags: bool = True, health_timeout: float = 2.0,
+                 include_exc_info: bool = True):
         """ Sends logs to an InfluxDB instance in a format compatible with InfluxDBs log view. Can be configured to
-        alter severity levels and send different log levels to specific buckets, allowing culling of old records.
+        alter severity levels and send different log levels to specific buckets, allowing culling of old records. The
+        client is created when the first record is emitted and its health is checked in the background, failures are
+        reported on stderr without blocking logging.
 
         :param name: application name to append to logs
         :param bucket: target bucket or mapping of log levels to buckets
@@ -80,26 +80,45 @@ class InfluxDBHandler(logging.Handler):
         :param level: minimum logging level
         :param measurement: measurement name, defaults to 'syslog'
         :param severity_map:
+        :param batch_size: maximum number of records written per request
+        :param flush_interval: maximum time in seconds records are held before being written
+        :param jitter_interval: maximum random delay in seconds added to each batch write, spreads load from many clients
+        :param extended_tags: if False only syslog compatible tags are written
+        :param health_timeout: maximum time in seconds to wait for health check response
+        :param include_exc_info: if False exception tracebacks are not included in messages
         """
         logging.Handler.__init__(self, level)
 
         name = name or get_args()
 
         # Force output formatter
-        logging.Handler.setFormatter(self, InfluxDBFormatter())
+        formatter = InfluxDBFormatter()
+        logging.Handler.setFormatter(self, formatter)
+
+        # Formatter is fixed so its format method can be bound once
+        self._format = formatter.format
+        self._include_exc_info = include_exc_info
 
         # Discard records from influxdb_client and urllib3 to prevent recursion
         self.addFilter(discard_name_prefix_factory('influxdb_client.'))
         self.addFilter(discard_name_prefix_factory('urllib3.'))
 
         self._measurement = measurement or 'syslog'
+        self._extended_tags = extended_tags
 
         # Setup bucket mapping
         self._bucket_map: MutableMapping[int, str] = {}
 
         if isinstance(bucket, collections.abc.Mapping):
             for bucket_level, bucket_name in bucket.items():
-                self._bucket_map[getattr(levels, bucket_level)] = bucket_name
+                if isinstance(bucket_level, str):
+                    try:
+                        bucket_level = levels.NAME_TO_LEVEL[bucket_level.upper()]
+                    except KeyError:
+                        raise InfluxDBHandlerError(f"Unknown logging level \"{bucket_level}\" for bucket "
+                                                   f"\"{bucket_name}\"") from None
+
+                self._bucket_map[int(bucket_level)] = bucket_name
         else:
             self._bucket_map[logging.NOTSET] = str(bucket)
 
@@ -118,80 +137,156 @@ class InfluxDBHandler(logging.Handler):
         self._bucket_min = min(self._bucket_map.keys())
         self._bucket_max = max(self._bucket_map.keys())
 
+        # Severity (with keyword) and bucket for each record level
+        self._severity_lookup = _NearestLevelMap({
+            severity_level: (severity_obj, severity_obj.keyword)
+            for severity_level, severity_obj in self._severity_map.items()
+        })
+        self._bucket_lookup = _NearestLevelMap(self._bucket_map)
+
         # Create tags common to all records
         self._point_settings = PointSettings(
             appname=name,
             facility=self.FACILITY,
-            host=socket.gethostname(),
-            hostname=socket.getfqdn()
+            host=get_hostname(),
+            hostname=get_fqdn()
         )
 
-        # Instantiate client and test connection
-        if client_args is None:
-            self._client = InfluxDBClient.from_env_properties()
-        else:
-            self._client = InfluxDBClient(**client_args, retries=self.RETRIES)
+        # Client is created on first record so handler construction does not block on the network
+        self._client_args = client_args
+        self._write_options = WriteOptions(write_type=WriteType.batching, batch_size=batch_size,
+                                           flush_interval=int(flush_interval * 1000),
+                                           jitter_interval=int(jitter_interval * 1000))
 
-        health = self._client.health()
+        self._health_timeout = health_timeout
+        self._healthy: Optional[bool] = None
 
-        if health.status != 'pass':
-            raise InfluxDBHandlerError(f"Health check failed with message: {health.message}")
+        self._client: Optional[InfluxDBClient] = None
+        self._write_api: Optional[WriteApi] = None
+        self._closed = False
 
-        self._write_api = self._client.write_api(point_settings=self._point_settings)
+    @property
+    def healthy(self) -> Optional[bool]:
+        """ Result of health check, None until check has completed. """
+        return self._healthy
 
     def close(self) -> None:
         super().close()
 
-        # Ensure client is closed on deletion
-        if hasattr(self, '_write_api'):
-            self._write_api.flush()
-            self._write_api.close()
+        # Prevent later records from creating a new client
+        self._closed = True
+
+        # Ensure client is closed on deletion (attributes may be missing if construction failed)
+        write_api = getattr(self, '_write_api', None)
+
+        if write_api is not None:
+            write_api.flush()
+            write_api.close()
+            self._write_api = None
+
+        client = getattr(self, '_client', None)
+
+        if client is not None:
+            client.close()
+            self._client = None
+
+    def _connect(self) -> WriteApi:
+        """ Instantiate client, start health check and create write API.
+
+        :return: write API, records are batched and written from a background thread
+        """
+        if self._client_args is None:
+            # Connection pool size is read from environment
+            client = InfluxDBClient.from_env_properties(enable_gzip=self.ENABLE_GZIP)
+        else:
+            client_args = dict(self._client_args)
+            client_args.setdefault('connection_pool_maxsize', self.CONNECTION_POOL_MAXSIZE)
+            client_args.setdefault('enable_gzip', self.ENABLE_GZIP)
+
+            client = InfluxDBClient(**client_args, retries=self.RETRIES)
+
+        self._client = client
+        self._write_api = client.write_api(write_options=self._write_options, point_settings=self._point_settings)
+
+        # Records are batched while health is checked, a failed check does not discard them
+        threading.Thread(target=self._health_check, args=(client,), name=f"{self.__class__.__name__}Health",
+                         daemon=True).start()
+
+        return self._write_api
+
+    def _health_check(self, client: InfluxDBClient) -> None:
+        """ Test connection to InfluxDB instance, failures are written to stderr as logging may loop back here.
+
+        :param client: client to test
+        """
+        try:
+            health = HealthService(client.api_client).get_health(_request_timeout=int(self._health_timeout * 1000))
+        except Exception as exc:
+            message = str(exc)
+        else:
+            if health.status == 'pass':
+                self._healthy = True
+                return
+
+            message = health.message
 
-        if hasattr(self, '_client'):
-            self._client.close()
+        self._healthy = False
+
+        if logging.raiseExceptions and sys.stderr:
+            sys.stderr.write(f"--- {self.__class__.__name__} health check failed with message: {message}\n")
 
     def setFormatter(self, fmt: Optional[logging.Formatter]) -> None:
         raise NotImplementedError('InfluxDB formatter cannot be changed, hard-coded to match syslog format')
 
     def emit(self, record: logging.LogRecord) -> None:
-        # Determine closest mappable severity level
-        severity_level = record.levelno
-
-        if severity_level not in self._severity_map:
-            severity_level = min(self._severity_map.keys(), key=lambda x: abs(x - severity_level))
-
-        severity = self._severity_map[severity_level]
-
-        # Find closest bucket in map
-        bucket = self._bucket_map[min(self._bucket_map.keys(), key=lambda x: abs(x - record.levelno))]
-
-        point = Point(self._measurement)
-
-        # Syslog compatible fields
-        point.field('facility_code', self.FACILITY_CODE)
-        point.field('message', self.format(record))
-        point.field('procid', record.process or 0)
-        point.field('severity_code', severity.value)
-        point.field('timestamp', record.created)
-        point.field('version', 1)
-
-        # Extended fields
-        point.field('levelno', record.levelno)
-        point.field('lineno', record.lineno)
-        point.field('relativeCreated', record.relativeCreated)
-
-        # Syslog compatible tags
-        point.tag('severity', severity.keyword)
-
-        # Extended tags
-        point.tag('name', record.name)
-        point.tag('filename', record.filename)
-        point.tag('funcName', record.funcName or '')
-        point.tag('levelname', record.levelname)
-        point.tag('module', record.module)
-        point.tag('pathname', record.pathname)
-        point.tag('processName', record.processName or '')
-        point.tag('threadName', record.threadName or '')
-
-        # Write point
-        self._write_api.write(bucket, record=point, write_precision=WritePrecision.NS)
+        if self._closed:
+            # Discard records emitted after close
+            return
+
+        try:
+            write_api = self._write_api or self._connect()
+
+            severity, keyword = self._severity_lookup[record.levelno]
+            bucket = self._bucket_lookup[record.levelno]
+
+            if self._include_exc_info:
+                message = self._format(record)
+            else:
+                message = _format_without_exc_info(self._format, record)
+
+            point = (
+                Point(self._measurement)
+                .time(int(record.created * 1e9), WritePrecision.NS)
+                # Syslog compatible fields
+                .field('facility_code', self.FACILITY_CODE)
+                .field('message', message)
+                .field('procid', record.process or 0)
+                .field('severity_code', severity.value)
+                .field('timestamp', record.created)
+                .field('version', 1)
+                # Extended fields
+                .field('levelno', record.levelno)
+                .field('lineno', record.lineno)
+                .field('relativeCreated', record.relativeCreated)
+                # Syslog compatible tags
+                .tag('severity', keyword)
+            )
+
+            if self._extended_tags:
+                # Extended tags
+                point.tag('name', record.name)
+                point.tag('filename', record.filename)
+                point.tag('funcName', record.funcName)
+                point.tag('levelname', record.levelname)
+                point.tag('module', record.module)
+                point.tag('pathname', record.pathname)
+                point.tag('processName', record.processName)
+                point.tag('threadName', record.threadName)
+
+            # Write point
+            # Point carries its own write precision
+            write_api.write(bucket, record=point)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import collections
 import logging
+import random
+import time
 from enum import IntEnum
 from json import JSONDecodeError
-from typing import Mapping, MutableMapping, Optional, Union, cast
+from typing import Deque, Dict, Mapping, MutableMapping, Optional, Tuple, Union, cast
 
-import tenacity
 import pushover
 
 from experimentlib.logging.filters import discard_name_prefix_factory
 from experimentlib.logging.formatters import PushoverFormatter
+from experimentlib.logging.handlers import _format_without_exc_info, _NearestLevelMap
 from experimentlib.util.arg_helper import get_args
 
 
@@ -21,27 +24,11 @@ class PushoverHandler(logging.Handler):
         HIGH = 1
         REQUIRE_CONFIRM = 2
 
-    class _RetryPushoverError(tenacity.retry_base):  # type:ignore[misc, name-defined]
-        def __call__(self, retry_state: tenacity.RetryCallState) -> bool:
-            exception = retry_state.outcome.exception()  # type:ignore[union-attr]
-
-            # Retry on connection or protocol errors
-            if any((isinstance(exception, t) for t in (ConnectionError, JSONDecodeError))):
-                return True
-
-            if isinstance(exception, pushover.RequestError):
-                if 'application token' in exception.errors:
-                    # Invalid API key, do not retry
-                    return False
-                elif 'user key' in exception.errors:
-                    # Invalid user key, do not retry
-                    return False
-                else:
-                    # Unknown error
-                    return False
-
-            # Otherwise do not retry
-            return False
+    # Retry timing (in seconds) for connection and protocol errors, waits are randomised with exponentially increasing
+    # upper bound to avoid many clients retrying in step
+    _RETRY_WAIT_BASE = 2
+    _RETRY_WAIT_MAX = 60
+    _RETRY_TIMEOUT = 600
 
     # Map logging levels to Pushover priority levels
     _DEFAULT_PRIORITY_MAP: Mapping[int, PushoverHandler.Priority] = {
@@ -54,7 +41,8 @@ class PushoverHandler(logging.Handler):
 
     def __init__(self, api_token: Optional[str], user_key: str, level: int = logging.NOTSET,
                  priority_map: Optional[MutableMapping[int, Union[int, Priority]]] = None,
-                 title: Optional[str] = None):
+                 title: Optional[str] = None, dedupe_interval: float = 0, rate_limit: Optional[int] = None,
+                 rate_period: float = 60, include_exc_info: bool = True):
         """
 
         :param api_token:
@@ -62,11 +50,21 @@ class PushoverHandler(logging.Handler):
         :param level:
         :param priority_map:
         :param title:
+        :param dedupe_interval: time in seconds during which repeated records (same logger, level and message) are not
+            sent, 0 to disable
+        :param rate_limit: maximum number of notifications sent per rate_period, None to disable
+        :param rate_period: rate limit period in seconds
+        :param include_exc_info: if False exception summaries are not included in messages
         """
         logging.Handler.__init__(self, level)
 
         # Force formatter
-        logging.Handler.setFormatter(self, PushoverFormatter())
+        formatter = PushoverFormatter()
+        logging.Handler.setFormatter(self, formatter)
+
+        # Formatter is fixed so its format method can be bound once
+        self._format = formatter.format
+        self._include_exc_info = include_exc_info
 
         # Discard records from urllib3 to prevent recursion
         self.addFilter(discard_name_prefix_factory('urllib3.'))
@@ -81,10 +79,20 @@ class PushoverHandler(logging.Handler):
 
         # Minimum and maximum supported priority
         self._priority_min = min(self._priority_map.keys())
-        self._priority_max = min(self._priority_map.keys())
+        self._priority_max = max(self._priority_map.keys())
+
+        # Priority value for each record level
+        self._priority_lookup = _NearestLevelMap({k: v.value for k, v in self._priority_map.items()})
 
         self._title = title or get_args()
 
+        # Suppression of repeated or excessive notifications, count of suppressed records is added to next title
+        self._dedupe_interval = dedupe_interval
+        self._dedupe_recent: Dict[Tuple[str, int, str], float] = {}
+        self._rate_period = rate_period
+        self._rate_sent: Optional[Deque[float]] = collections.deque(maxlen=rate_limit) if rate_limit else None
+        self._suppressed = 0
+
         # Instantiate client and test connection
         self._client: Optional[pushover.Pushover] = None
         self._user_key = user_key
@@ -98,38 +106,95 @@ class PushoverHandler(logging.Handler):
     def setFormatter(self, fmt: Optional[logging.Formatter]) -> None:
         raise NotImplementedError('Formatter cannot be changed')
 
+    def handle(self, record: logging.LogRecord) -> bool:
+        if self._client is None:
+            # Skip filtering, locking and formatting if API token is not configured
+            return False
+
+        return logging.Handler.handle(self, record)
+
+    def _suppress(self, record: logging.LogRecord) -> bool:
+        """ Check if a record should be suppressed as a repeat of a recent record or due to the rate limit, otherwise
+        record it as sent.
+
+        :param record: log record
+        :return: True if record should not be sent, False otherwise
+        """
+        if not self._dedupe_interval and self._rate_sent is None:
+            return False
+
+        now = time.monotonic()
+
+        if self._dedupe_interval:
+            key = (record.name, record.levelno, record.getMessage())
+
+            if now - self._dedupe_recent.get(key, -self._dedupe_interval) < self._dedupe_interval:
+                return True
+
+        if self._rate_sent is not None and len(self._rate_sent) == self._rate_sent.maxlen and \
+                now - self._rate_sent[0] < self._rate_period:
+            return True
+
+        if self._dedupe_interval:
+            # Discard expired entries before adding new record
+            expiry = now - self._dedupe_interval
+            self._dedupe_recent = {k: t for k, t in self._dedupe_recent.items() if t > expiry}
+            self._dedupe_recent[key] = now
+
+        if self._rate_sent is not None:
+            self._rate_sent.append(now)
+
+        return False
+
     def emit(self, record: logging.LogRecord) -> None:
         if self._client is None:
             # Skip is API token is not configured
             return
 
-        # Format record
-        msg = self.format(record)
+        if self._suppress(record):
+            self._suppressed += 1
+            return
 
-        # Determine closest mappable priority level
-        level = record.levelno
+        title = self._title or record.name
+        priority = self._priority_lookup[record.levelno]
 
-        if level not in self._priority_map:
-            level = min(self._priority_map.keys(), key=lambda x: abs(x - level))
+        if self._suppressed > 0:
+            title = f"{title} (+{self._suppressed} suppressed)"
+            self._suppressed = 0
 
-        title = self._title or record.name
-        priority = self._priority_map[level]
+        # Format record
+        if self._include_exc_info:
+            msg = self._format(record)
+        else:
+            msg = _format_without_exc_info(self._format, record)
 
         # Send message to Pushover client (with retrying and rate limiting)
         try:
-            self._send_message(msg, priority.value, title, int(record.created), True)
-        except pushover.RequestError:
+            self._send_message(msg, priority, title, int(record.created), True)
+        except (pushover.RequestError, ConnectionError, JSONDecodeError):
             self.handleError(record)
 
-    
-    @tenacity.retry(
-        retry=_RetryPushoverError(),
-        stop=tenacity.stop_after_delay(600), # type: ignore[attr-defined, no-untyped-call]
-        wait=tenacity.wait_fixed(30) # type: ignore[attr-defined, no-untyped-call]
-    )
     def _send_message(self, msg: str, priority: int, title: str, timestamp: int, html: bool) -> None:
         if self._client is None:
             # Skip is API token is not configured
             return
 
-        self._client.message(self._user_key, msg, priority=priority, title=title, timestamp=timestamp, html=int(html))
+        deadline = time.monotonic() + self._RETRY_TIMEOUT
+        attempt = 0
+
+        while True:
+            try:
+                self._client.message(self._user_key, msg, priority=priority, title=title, timestamp=timestamp,
+                                     html=int(html))
+                return
+            except (ConnectionError, JSONDecodeError):
+                # Retry on connection or protocol errors, other errors (including invalid keys) are not retried
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    raise
+
+            wait = random.uniform(0, min(self._RETRY_WAIT_MAX, self._RETRY_WAIT_BASE * 2 ** attempt))
+            attempt += 1
+
+            time.sleep(min(wait, remaining))
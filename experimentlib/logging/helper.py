@@ -1,25 +1,27 @@
-import getpass
 import typing
 import platform
-import socket
 import sys
 
 from experimentlib import logging
+from experimentlib.util.host import get_fqdn, get_username
 
 
 def log_system(logger: typing.Optional[logging.ExtendedLogger] = None, level: int = logging.INFO) -> None:
     if logger is None:
         logger = logging.get_logger(__name__)
 
+    if not logger.isEnabledFor(level):
+        return
+
     # Launch arguments
-    logger.log(level, f"Launch arguments: {' '.join(sys.argv)}")
+    logger.log(level, 'Launch arguments: %s', ' '.join(sys.argv))
 
     # Platform version
-    logger.log(level, f"Interpreter: {sys.executable}")
-    logger.log(level, "Version: {}".format(sys.version.replace('\n', ' ')))
-    logger.log(level, f"Platform: {platform.python_implementation()}")
-    logger.log(level, f"Path: {';'.join(sys.path)}")
+    logger.log(level, 'Interpreter: %s', sys.executable)
+    logger.log(level, 'Version: %s', sys.version.replace('\n', ' '))
+    logger.log(level, 'Platform: %s', platform.python_implementation())
+    logger.log(level, 'Path: %s', ';'.join(sys.path))
 
     # System information
-    logger.log(level, f"Hostname: {socket.getfqdn()}")
-    logger.log(level, f"Username: {getpass.getuser()}")
+    logger.log(level, 'Hostname: %s', get_fqdn())
+    logger.log(level, 'Username: %s', get_username())
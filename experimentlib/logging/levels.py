@@ -1,4 +1,5 @@
 import logging
+from types import MappingProxyType
 
 
 __all__ = ['NOTSET', 'META', 'LOCK', 'TRACE', 'SLEEP', 'DEBUG', 'COMM', 'INFO', 'WARNING', 'ERROR', 'CRITICAL', 'NAME_TO_LEVEL']
@@ -13,24 +14,25 @@ ERROR = logging.ERROR
 CRITICAL = logging.CRITICAL
 
 
-# Additional logging levels
-# Logging about logging
-setattr(logging, 'META', logging.NOTSET + 1)
-# Logging lock acquisition/release
-setattr(logging, 'LOCK', logging.DEBUG - 3)
-# Logging for detailed debugging
-setattr(logging, 'TRACE', logging.DEBUG - 2)
-# Logging for sleep
-setattr(logging, 'SLEEP', logging.DEBUG - 1)
-# Logging external I/O
-setattr(logging, 'COMM', logging.DEBUG + 1)
-
-# noinspection PyUnresolvedReferences
-logging.addLevelName(logging.META, 'META')  # type: ignore[attr-defined]
-logging.addLevelName(logging.LOCK, 'LOCKS')  # type: ignore[attr-defined]
-logging.addLevelName(logging.TRACE, 'TRACE')  # type: ignore[attr-defined]
-logging.addLevelName(logging.SLEEP, 'SLEEP')  # type: ignore[attr-defined]
-logging.addLevelName(logging.COMM, 'COMM')  # type: ignore[attr-defined]
+# Additional logging levels, registered once so reloading this module does not alter global logging state
+if not hasattr(logging, 'META'):
+    # Logging about logging
+    setattr(logging, 'META', logging.NOTSET + 1)
+    # Logging lock acquisition/release
+    setattr(logging, 'LOCK', logging.DEBUG - 3)
+    # Logging for detailed debugging
+    setattr(logging, 'TRACE', logging.DEBUG - 2)
+    # Logging for sleep
+    setattr(logging, 'SLEEP', logging.DEBUG - 1)
+    # Logging external I/O
+    setattr(logging, 'COMM', logging.DEBUG + 1)
+
+    # noinspection PyUnresolvedReferences
+    logging.addLevelName(logging.META, 'META')  # type: ignore[attr-defined]
+    logging.addLevelName(logging.LOCK, 'LOCKS')  # type: ignore[attr-defined]
+    logging.addLevelName(logging.TRACE, 'TRACE')  # type: ignore[attr-defined]
+    logging.addLevelName(logging.SLEEP, 'SLEEP')  # type: ignore[attr-defined]
+    logging.addLevelName(logging.COMM, 'COMM')  # type: ignore[attr-defined]
 
 META = logging.META  # type: ignore[attr-defined]
 LOCK = logging.LOCK  # type: ignore[attr-defined]
@@ -38,7 +40,8 @@ TRACE = logging.TRACE  # type: ignore[attr-defined]
 SLEEP = logging.SLEEP  # type: ignore[attr-defined]
 COMM = logging.COMM  # type: ignore[attr-defined]
 
-NAME_TO_LEVEL = {
+# Read-only lookup of level names to numbers, including aliases
+NAME_TO_LEVEL = MappingProxyType({
     'NOTSET': NOTSET,
     'META': META,
     'LOCK': LOCK,
@@ -52,4 +55,4 @@ NAME_TO_LEVEL = {
     'ERROR': ERROR,
     'CRITICAL': CRITICAL,
     'FATAL': CRITICAL
-}
+})
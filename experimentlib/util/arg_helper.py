@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections
+import functools
 import os.path
 import re
 import sys
@@ -21,13 +22,59 @@ _DATETIME_FORMAT = [
     FORMAT_DATE
 ]
 
-_REGEX_TIMESTAMP = re.compile(r'^([\d]+\.?[\d]*)([smun]?)$')
+# Patterns for strptime directives used in known formats, matches are a superset of values accepted by strptime
+_DATETIME_DIRECTIVE_REGEX = {
+    'Y': r'\d{4}',
+    'm': r'\d{1,2}',
+    'd': r'\d{1,2}',
+    'H': r'\d{1,2}',
+    'M': r'\d{1,2}',
+    'S': r'\d{1,2}',
+    '%': '%'
+}
+
+
+def _datetime_format_regex(datetime_format: str) -> Optional[typing.Pattern[str]]:
+    """ Build regular expression used to quickly reject values that cannot match a strptime format.
+
+    :param datetime_format: strptime format str
+    :return: compiled regular expression, None if format includes unsupported directives
+    """
+    regex = []
+
+    for n, part in enumerate(re.split(r'(%.)', datetime_format)):
+        if n % 2:
+            try:
+                regex.append(_DATETIME_DIRECTIVE_REGEX[part[1]])
+            except KeyError:
+                return None
+        else:
+            # strptime allows any amount of whitespace where whitespace appears in format
+            regex.append(r'\s+'.join(re.escape(literal) for literal in re.split(r'\s+', part)))
+
+    return re.compile(''.join(regex), re.IGNORECASE)
+
+
+_DATETIME_REGEX = [(datetime_format, _datetime_format_regex(datetime_format)) for datetime_format in _DATETIME_FORMAT]
+
+# Timestamp with optional unit suffix, used with fullmatch
+_REGEX_TIMESTAMP = re.compile(r'(\d+(?:\.\d*)?)([smunSMUN]?)')
 
 _ARG_DELIMITER = ':'
 _LIST_DELIMITER = ','
 _VALUE_DELIMITER = '='
 
 
+@functools.lru_cache(maxsize=32)
+def _escaped_split_regex(delimiter: str) -> typing.Pattern[str]:
+    """ Get compiled regular expression matching a delimiter not preceded by an escape character.
+
+    :param delimiter: delimiter character(s)
+    :return: compiled regular expression
+    """
+    return re.compile(r'(?<!\\)' + re.escape(delimiter))
+
+
 class ArgumentError(ValueError):
     pass
 
@@ -79,6 +126,39 @@ class SimpleArgParser(object):
 
         self._arg_parser_mapping: typing.OrderedDict[str, SimpleArgParser._SimpleArg] = collections.OrderedDict()
 
+    def _split(self, arg_str: str) -> typing.List[str]:
+        """ Split argument string on list delimiter, ignoring delimiters enclosed in single or double quotes.
+
+        :param arg_str: input str
+        :return: list of argument str
+        """
+        if '"' not in arg_str and "'" not in arg_str:
+            return arg_str.split(self._list_delimiter)
+
+        arg_split = []
+        start = 0
+        n = 0
+
+        while n < len(arg_str):
+            c = arg_str[n]
+
+            if c == '"' or c == "'":
+                # Skip to closing quote, unterminated quotes extend to end of input
+                n = arg_str.find(c, n + 1)
+
+                if n < 0:
+                    break
+            elif arg_str.startswith(self._list_delimiter, n):
+                arg_split.append(arg_str[start:n])
+                n = start = n + len(self._list_delimiter)
+                continue
+
+            n += 1
+
+        arg_split.append(arg_str[start:])
+
+        return arg_split
+
     @staticmethod
     def _macro_lower(x: str) -> str:
         return x.lower()
@@ -123,11 +203,12 @@ class SimpleArgParser(object):
         :param arg_str:
         :return:
         """
-        arg_namespace = {}
-        arg_split = re.split(self._list_delimiter + '''(?=(?:[^'"]|'[^']*'|"[^"]*")*$)''', arg_str)
+        arg_namespace = SimpleNamespace()
+        arg_split = self._split(arg_str)
 
-        # Tracking for positional arguments
-        arg_parser_mapping = self._arg_parser_mapping.copy()
+        # Tracking for positional and consumed arguments, avoids copying argument mapping
+        arg_positional = iter(self._arg_parser_mapping.items())
+        arg_parsed = set()
         arg_pos = True
 
         for arg_n, arg_value in enumerate(arg_split):
@@ -136,13 +217,13 @@ class SimpleArgParser(object):
                 arg_name, arg_value = arg_value.split(self._arg_delimiter, 1)
                 arg_name = arg_name.strip().lower()
 
-                if arg_name in arg_namespace:
+                if arg_name in arg_parsed:
                     raise ArgumentError(f"Duplicate argument \"{arg_name}\" in \"{arg_str}\"")
 
-                if arg_name not in arg_parser_mapping:
-                    raise ArgumentError(f"Unknown argument \"{arg_name}\" in \"{arg_str}\"")
-
-                arg_parser = arg_parser_mapping.pop(arg_name)
+                try:
+                    arg_parser = self._arg_parser_mapping[arg_name]
+                except KeyError:
+                    raise ArgumentError(f"Unknown argument \"{arg_name}\" in \"{arg_str}\"") from None
 
                 # No additional positional arguments allowed
                 arg_pos = False
@@ -150,25 +231,31 @@ class SimpleArgParser(object):
                 if not arg_pos:
                     raise ArgumentError(f"Positional argument used after keyword argument in \"{arg_str}\"")
 
-                if len(arg_parser_mapping) == 0:
-                    raise ArgumentError(f"Unmatched argument name \"{arg_str}\"")
+                try:
+                    arg_name, arg_parser = next(arg_positional)
+                except StopIteration:
+                    raise ArgumentError(f"Unmatched argument name \"{arg_str}\"") from None
 
-                arg_name, arg_parser = arg_parser_mapping.popitem(False)
+            arg_parsed.add(arg_name)
 
             if arg_parser.greedy:
-                arg_namespace[arg_name] = [arg_parser.parse(x.strip()) for x in [arg_value] + arg_split[arg_n + 1:]]
+                setattr(arg_namespace, arg_name,
+                        [arg_parser.parse(x.strip()) for x in [arg_value] + arg_split[arg_n + 1:]])
                 break
 
-            arg_namespace[arg_name] = arg_parser.parse(arg_value.strip())
+            setattr(arg_namespace, arg_name, arg_parser.parse(arg_value.strip()))
 
         # Add any remaining argument defaults
-        for arg_parser in arg_parser_mapping.values():
+        for arg_name, arg_parser in self._arg_parser_mapping.items():
+            if arg_name in arg_parsed:
+                continue
+
             if arg_parser.required:
                 raise ArgumentError(f"Argument {arg_parser.name} must be provided")
 
-            arg_namespace[arg_parser.name] = arg_parser.default
+            setattr(arg_namespace, arg_name, arg_parser.default)
 
-        return SimpleNamespace(**arg_namespace)
+        return arg_namespace
 
 
 def get_args() -> str:
@@ -186,16 +273,17 @@ def parse_datetime(value: str, parse_tz: Optional[tzinfo] = None) -> datetime:
     # Default to local datetime
     parse_tz = parse_tz or get_localzone()
 
-    timestamp_match = _REGEX_TIMESTAMP.match(value.lower())
+    timestamp_match = _REGEX_TIMESTAMP.fullmatch(value)
 
     if timestamp_match is not None:
         timestamp = float(timestamp_match[1])
+        timestamp_unit = timestamp_match[2].lower()
 
-        if timestamp_match[2] == 'm':
+        if timestamp_unit == 'm':
             timestamp /= 1e3
-        elif timestamp_match[2] == 'u':
+        elif timestamp_unit == 'u':
             timestamp /= 1e6
-        elif timestamp_match[2] == 'n':
+        elif timestamp_unit == 'n':
             timestamp /= 1e9
 
         dt = datetime.fromtimestamp(timestamp)
@@ -204,7 +292,10 @@ def parse_datetime(value: str, parse_tz: Optional[tzinfo] = None) -> datetime:
     else:
         dt = None
 
-        for datetime_format in _DATETIME_FORMAT:
+        for datetime_format, datetime_regex in _DATETIME_REGEX:
+            if datetime_regex is not None and datetime_regex.fullmatch(value) is None:
+                continue
+
             try:
                 dt = datetime.strptime(value, datetime_format)
                 break
@@ -241,7 +332,7 @@ def parse_pair(value: str, value_separator: Optional[str] = None,
     if list_delimiter is not None:
         # Split input based on delimiter
         if escape:
-            pair_set = re.split(r'(?<!\\)' + list_delimiter, value)
+            pair_set = _escaped_split_regex(list_delimiter).split(value)
         else:
             pair_set = value.split(list_delimiter)
 
@@ -259,7 +350,7 @@ def parse_pair(value: str, value_separator: Optional[str] = None,
     value = value.strip()
 
     if escape:
-        value_set = re.split(r'(?<!\\)' + value_separator, value)
+        value_set = _escaped_split_regex(value_separator).split(value)
     else:
         value_set = value.split(value_separator)
 
@@ -1,5 +1,6 @@
 import functools
 import inspect
+import types
 import typing
 import sys
 
@@ -15,21 +16,28 @@ class HybridMethod(object):
 
      From: https://stackoverflow.com/questions/18078744/python-hybrid-between-regular-method-and-classmethod """
 
-    def __init__(self, func):
+    def __init__(self, func, cls_func=None):
         self.func = func
+        self.cls_func = cls_func
 
-    def __get__(self, obj, cls):
-        context = obj if obj is not None else cls
+    def class_method(self, cls_func):
+        """ Decorator to provide a separate implementation used when the method is called on the class.
 
-        @functools.wraps(self.func)
-        def hybrid(*args, **kw):
-            return self.func(context, *args, **kw)
+        :param cls_func: method called with the class as the first argument
+        :return: HybridMethod
+        """
+        return type(self)(self.func, cls_func)
 
-        # optional, mimic methods some more
-        hybrid.__func__ = hybrid.im_func = self.func
-        hybrid.__self__ = hybrid.im_self = context
+    def __get__(self, obj, cls):
+        if obj is not None:
+            context = obj
+            func = self.func
+        else:
+            context = cls
+            func = self.cls_func or self.func
 
-        return hybrid
+        # Bound method provides __func__, __self__ and wrapped metadata without creating a closure per access
+        return types.MethodType(func, context)
 
 
 TObject = typing.TypeVar('TObject', bound=object)
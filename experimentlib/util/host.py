@@ -0,0 +1,30 @@
+import functools
+import getpass
+import socket
+
+
+@functools.lru_cache(maxsize=None)
+def get_hostname() -> str:
+    """ Get local host name, resolved once per process.
+
+    :return: host name
+    """
+    return socket.gethostname()
+
+
+@functools.lru_cache(maxsize=None)
+def get_fqdn() -> str:
+    """ Get fully qualified domain name of local host, resolved once per process as lookup may block on DNS.
+
+    :return: fully qualified domain name
+    """
+    return socket.getfqdn()
+
+
+@functools.lru_cache(maxsize=None)
+def get_username() -> str:
+    """ Get name of current user, resolved once per process.
+
+    :return: user name
+    """
+    return getpass.getuser()
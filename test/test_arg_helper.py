@@ -0,0 +1,50 @@
+import unittest
+
+from experimentlib.util import arg_helper
+
+
+class TestUtilArgHelper(unittest.TestCase):
+    def setUp(self):
+        self.parser = arg_helper.SimpleArgParser()
+        self.parser.add_argument('a')
+        self.parser.add_argument('b', default='default', required=False)
+        self.parser.add_argument('c', greedy=True, required=False)
+
+    def test_parse_positional(self):
+        parsed = self.parser.parse('1, 2, 3, 4')
+
+        self.assertEqual(parsed.a, '1')
+        self.assertEqual(parsed.b, '2')
+        self.assertEqual(parsed.c, ['3', '4'])
+
+    def test_parse_keyword(self):
+        parsed = self.parser.parse('1,c:3')
+
+        self.assertEqual(parsed.a, '1')
+        self.assertEqual(parsed.b, 'default')
+        self.assertEqual(parsed.c, ['3'])
+
+    def test_parse_quoted(self):
+        parsed = self.parser.parse('"1,2",b:\'3,"4"\',c:5')
+
+        self.assertEqual(parsed.a, '"1,2"')
+        self.assertEqual(parsed.b, '\'3,"4"\'')
+        self.assertEqual(parsed.c, ['5'])
+
+    def test_parse_multiple_char_delimiter(self):
+        parser = arg_helper.SimpleArgParser(list_delimiter='||')
+        parser.add_argument('a')
+        parser.add_argument('b')
+
+        parsed = parser.parse('1|2||"3||4"')
+
+        self.assertEqual(parsed.a, '1|2')
+        self.assertEqual(parsed.b, '"3||4"')
+
+    def test_parse_missing_required(self):
+        with self.assertRaises(arg_helper.ArgumentError):
+            self.parser.parse('b:2')
+
+    def test_parse_duplicate(self):
+        with self.assertRaises(arg_helper.ArgumentError):
+            self.parser.parse('a:1,a:2')
@@ -0,0 +1,82 @@
+import logging
+import sys
+import unittest
+
+from experimentlib.logging.formatters import PushoverFormatter
+
+
+_TRACEBACK_CHAINED = '''Traceback (most recent call last):
+  File "/opt/app/sensor.py", line 12, in read
+    value = self._port.read(4)
+  File "/opt/app/port.py", line 40, in read
+    raise OSError('timeout')
+OSError: timeout
+
+During handling of the above exception, another exception occurred:
+
+Traceback (most recent call last):
+  File "/opt/app/main.py", line 7, in <module>
+    run()
+  File "/opt/app/main.py", line 3, in run
+    x = 1 / 0
+        ~~^~~
+ZeroDivisionError: division by zero'''
+
+_HEADER = '''Sensor read failed
+
+<b>Logger:</b> test.logger
+<b>Level:</b> ERROR
+<b>File:</b> main.py:3
+<b>Thread:</b> MainThread (id: 1)
+<b>Process:</b> MainProcess (id: 2)'''
+
+
+def _record(msg: str = 'Sensor read failed', exc_text: str = _TRACEBACK_CHAINED) -> logging.LogRecord:
+    try:
+        raise ZeroDivisionError('division by zero')
+    except ZeroDivisionError:
+        exc_info = sys.exc_info()
+
+    record = logging.LogRecord('test.logger', logging.ERROR, '/opt/app/main.py', 3, msg, None, exc_info)
+    record.threadName = 'MainThread'
+    record.thread = 1
+    record.processName = 'MainProcess'
+    record.process = 2
+
+    # Fixed traceback text so output does not depend on Python version
+    record.exc_text = exc_text
+
+    return record
+
+
+class TestLoggingPushoverFormatter(unittest.TestCase):
+    def test_traceback_summary(self):
+        # Matches output of the previous line-by-line parser, except the exception section is now separated from the
+        # header by a blank line and column markers are not reported as source code
+        self.assertEqual(PushoverFormatter().format(_record()), _HEADER + '''
+
+<b>Exception:</b> OSError: timeout
+  <b>from:</b> read in "/opt/app/port.py", line 40
+  <b>code:</b> <tt>raise OSError('timeout')</tt>
+
+<b>Exception:</b> ZeroDivisionError: division by zero
+  <b>from:</b> run in "/opt/app/main.py", line 3
+  <b>code:</b> <tt>x = 1 / 0</tt>''')
+
+    def test_traceback_no_source(self):
+        exc_text = '''Traceback (most recent call last):
+  File "<stdin>", line 1, in <module>
+KeyboardInterrupt'''
+
+        self.assertEqual(PushoverFormatter().format(_record(exc_text=exc_text)), _HEADER + '''
+
+<b>Exception:</b> KeyboardInterrupt
+  <b>from:</b> &lt;module&gt; in "<stdin>", line 1
+  <b>code:</b> <tt>unknown</tt>''')
+
+    def test_truncate(self):
+        msg = PushoverFormatter().format(_record('x' * 2000))
+
+        self.assertEqual(len(msg), PushoverFormatter._MSG_CHAR_LIMIT)
+        self.assertEqual(msg, 'x' * PushoverFormatter._MSG_CHAR_LIMIT)
+
@@ -0,0 +1,79 @@
+import logging
+import threading
+import time
+import typing
+import unittest
+
+from experimentlib.logging.handlers import BufferedHandler, _NearestLevelMap
+
+
+def _record(msg: str = 'message', created: typing.Optional[float] = None) -> logging.LogRecord:
+    record = logging.LogRecord('test', logging.INFO, __file__, 1, msg, None, None)
+
+    if created is not None:
+        record.created = created
+
+    return record
+
+
+class TestLoggingBufferedHandler(unittest.TestCase):
+    def _run(self, func: typing.Callable[[], typing.Any]) -> typing.Any:
+        # Run in separate thread so a hang fails the test instead of blocking the test run
+        result = []
+
+        thread = threading.Thread(target=lambda: result.append(func()), daemon=True)
+        thread.start()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive(), 'BufferedHandler did not return')
+
+        return result[0]
+
+    def test_timeout_unexpired(self):
+        handler = BufferedHandler(record_timeout=60)
+
+        # Eviction previously looped forever when the oldest record had not expired
+        self._run(lambda: handler.handle(_record('first')))
+        self._run(lambda: handler.handle(_record('second')))
+
+        self.assertEqual([r.msg for r in self._run(lambda: handler.records)], ['first', 'second'])
+
+    def test_timeout_expired(self):
+        handler = BufferedHandler(record_timeout=60)
+
+        self._run(lambda: handler.handle(_record('old', time.time() - 120)))
+        self._run(lambda: handler.handle(_record('new')))
+
+        self.assertEqual([r.msg for r in self._run(lambda: handler.records)], ['new'])
+
+    def test_record_limit(self):
+        handler = BufferedHandler(record_limit=2)
+
+        for n in range(3):
+            handler.handle(_record(str(n)))
+
+        self.assertEqual([r.msg for r in handler.records], ['1', '2'])
+
+
+class TestLoggingNearestLevelMap(unittest.TestCase):
+    def test_nearest(self):
+        lookup = _NearestLevelMap({logging.DEBUG: 'debug', logging.WARNING: 'warning', logging.CRITICAL: 'critical'})
+
+        self.assertEqual(lookup[logging.NOTSET], 'debug')
+        self.assertEqual(lookup[logging.DEBUG + 1], 'debug')
+        self.assertEqual(lookup[logging.WARNING - 1], 'warning')
+        self.assertEqual(lookup[logging.CRITICAL + 10], 'critical')
+
+    def test_equidistant_insertion_order(self):
+        # Levels equidistant from two configured levels resolve to the level listed first, as min() did previously
+        self.assertEqual(_NearestLevelMap({logging.DEBUG: 'debug', logging.WARNING: 'warning'})[logging.INFO], 'debug')
+        self.assertEqual(_NearestLevelMap({logging.WARNING: 'warning', logging.DEBUG: 'debug'})[logging.INFO],
+                         'warning')
+
+    def test_equidistant_matches_min(self):
+        mapping = {logging.CRITICAL: 'critical', logging.INFO: 'info', logging.ERROR: 'error', logging.NOTSET: 'notset'}
+        lookup = _NearestLevelMap(mapping)
+
+        for levelno in range(0, 60):
+            with self.subTest(levelno=levelno):
+                self.assertEqual(lookup[levelno], mapping[min(mapping, key=lambda x: abs(x - levelno))])
@@ -0,0 +1,51 @@
+import logging
+import unittest
+
+from experimentlib import logging as elib_logging
+
+
+class _RecordHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+class TestLoggingExtendedLogger(unittest.TestCase):
+    def setUp(self):
+        self.logger = elib_logging.get_logger('test.logging.extended')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+
+        self.handler = _RecordHandler()
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def test_exception_default_flags(self):
+        try:
+            raise ValueError('test')
+        except ValueError:
+            self.logger.exception('failed')
+
+        record = self.handler.records[0]
+
+        self.assertTrue(record.notify)
+        self.assertTrue(record.event)
+        self.assertIs(record.exc_info[0], ValueError)
+
+    def test_exception_flags(self):
+        try:
+            raise ValueError('test')
+        except ValueError:
+            self.logger.exception('failed', notify=False, event=False)
+
+        record = self.handler.records[0]
+
+        self.assertEqual(record.levelno, logging.ERROR)
+        self.assertFalse(record.notify)
+        self.assertFalse(record.event)
+        self.assertIs(record.exc_info[0], ValueError)
+        self.assertEqual(record.funcName, 'test_exception_flags')
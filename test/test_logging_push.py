@@ -0,0 +1,137 @@
+import importlib.util
+import logging
+import unittest
+from unittest import mock
+
+# Only skip when the third-party package is missing, import errors within the handler module should fail
+_HAS_PUSHOVER = importlib.util.find_spec('pushover') is not None
+
+if _HAS_PUSHOVER:
+    from experimentlib.logging.handlers import push
+
+
+class FakeClient(object):
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.sent = []
+
+    def message(self, user_key, msg, **kwargs):
+        if self.failures != 0:
+            self.failures -= 1
+            raise ConnectionError('fake connection error')
+
+        self.sent.append((msg, kwargs))
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, interval):
+        self.sleeps.append(interval)
+        self.now += interval
+
+
+@unittest.skipUnless(_HAS_PUSHOVER, 'pushover not installed')
+class TestLoggingPushover(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+        patch_time = mock.patch.multiple(push.time, monotonic=self.clock.monotonic, sleep=self.clock.sleep)
+        patch_time.start()
+        self.addCleanup(patch_time.stop)
+
+    def _handler(self, client, **kwargs):
+        handler = push.PushoverHandler('token', 'user', title='test', **kwargs)
+        handler._client = client
+
+        return handler
+
+    @staticmethod
+    def _record(msg='message', level=logging.WARNING):
+        return logging.LogRecord('test', level, __file__, 1, msg, None, None)
+
+    def test_dedupe_within_interval(self):
+        client = FakeClient()
+        handler = self._handler(client, dedupe_interval=10)
+
+        handler.handle(self._record())
+        self.clock.now += 5
+        handler.handle(self._record())
+        handler.handle(self._record('other message'))
+
+        self.assertEqual(len(client.sent), 2)
+
+    def test_dedupe_after_interval(self):
+        client = FakeClient()
+        handler = self._handler(client, dedupe_interval=10)
+
+        handler.handle(self._record())
+        self.clock.now += 5
+        handler.handle(self._record())
+        self.clock.now += 10
+        handler.handle(self._record())
+
+        self.assertEqual(len(client.sent), 2)
+        self.assertEqual(client.sent[1][1]['title'], 'test (+1 suppressed)')
+
+    def test_rate_limit(self):
+        client = FakeClient()
+        handler = self._handler(client, rate_limit=3, rate_period=60)
+
+        for n in range(5):
+            handler.handle(self._record(f"message {n}"))
+
+        self.assertEqual(len(client.sent), 3)
+
+        self.clock.now += 60
+        handler.handle(self._record('message 5'))
+
+        self.assertEqual(len(client.sent), 4)
+        self.assertEqual(client.sent[3][1]['title'], 'test (+2 suppressed)')
+
+    def test_retry_backoff(self):
+        client = FakeClient(failures=5)
+        handler = self._handler(client)
+
+        with mock.patch.object(push.random, 'uniform', side_effect=lambda a, b: b) as uniform:
+            handler.handle(self._record())
+
+        self.assertEqual(len(client.sent), 1)
+        self.assertEqual([c.args for c in uniform.call_args_list], [(0, 2), (0, 4), (0, 8), (0, 16), (0, 32)])
+        self.assertEqual(self.clock.sleeps, [2, 4, 8, 16, 32])
+
+    def test_retry_wait_max(self):
+        client = FakeClient(failures=7)
+        handler = self._handler(client)
+
+        with mock.patch.object(push.random, 'uniform', side_effect=lambda a, b: b):
+            handler.handle(self._record())
+
+        self.assertEqual(len(client.sent), 1)
+        self.assertEqual(max(self.clock.sleeps), push.PushoverHandler._RETRY_WAIT_MAX)
+
+    def test_retry_timeout(self):
+        client = FakeClient(failures=-1)
+        handler = self._handler(client)
+
+        with mock.patch.object(push.random, 'uniform', side_effect=lambda a, b: b):
+            with self.assertRaises(ConnectionError):
+                handler._send_message('message', 0, 'test', 0, True)
+
+        self.assertEqual(len(client.sent), 0)
+        self.assertEqual(sum(self.clock.sleeps), push.PushoverHandler._RETRY_TIMEOUT)
+
+    def test_retry_failure_handled(self):
+        client = FakeClient(failures=-1)
+        handler = self._handler(client)
+
+        with mock.patch.object(handler, 'handleError') as handle_error:
+            handler.handle(self._record())
+
+        handle_error.assert_called_once()
+        self.assertEqual(len(client.sent), 0)